@@ -4,11 +4,6 @@ or bias subtractions, it only shows how rotations are handled.
 """
 
 import numpy as np
-import os
-from autoconf import conf
-import matplotlib.pyplot as plt
-
-import pickle
 import autoarray as aa
 import autoarray.plot as aplt
 from os import path
@@ -55,7 +50,6 @@ image_aa = aa.acs.ImageACS.from_fits(
     bias_subtract_via_prescan=True,
 )
 
-mat_plot_2d = aplt.MatPlot2D(cmap=aplt.Cmap(vmin=0.0, vmax=10.0))
 array_plotter = aplt.Array2DPlotter(array=image_aa, mat_plot_2d=mat_plot_2d)
 array_plotter.figure_2d()
 
@@ -3,14 +3,7 @@ This script illustrates extractions of CCD sections from ACS .fits imaging. It d
 or bias subtractions, it only shows how rotations are handled.
 """
 
-import numpy as np
-import os
-from autoconf import conf
-import matplotlib.pyplot as plt
-
-import pickle
 import autoarray as aa
-import autoarray.plot as aplt
 from os import path
 
 """
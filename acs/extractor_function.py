@@ -25,11 +25,12 @@ def extract_quadrant(file_path, quadrant_letter, bias_path=None):
         raise exc.ArrayException("Quadrant letter for FrameACS must be A, B, C or D.")
 
     """
-    Load relevent fits info from image file.
+    Load relevent fits info and the unscaled image data from image file.
     """
-    hdulist = fits.open(file_path)
-
-    sci_header = hdulist[0].header
+    with fits.open(file_path, do_not_scale_image_data=True) as hdu_list:
+        sci_header = hdu_list[0].header
+        ext_header = hdu_list[hdu].header
+        array = np.array(hdu_list[hdu].data)
 
     if sci_header["TELESCOP"] != "HST":
         raise exc.ArrayException(
@@ -45,19 +46,13 @@ def extract_quadrant(file_path, quadrant_letter, bias_path=None):
     date_of_observation = sci_header["DATE-OBS"]
     time_of_observation = sci_header["TIME-OBS"]
 
-    ext_header = hdulist[hdu].header
-
     units = ext_header["BUNIT"]
     bscale = ext_header["BSCALE"]
     bzero = ext_header["BZERO"]
 
-    hdu_list = fits.open(file_path, do_not_scale_image_data=True)
-
     """
-    Load image data and convert using bscale.
+    Convert image data using bscale.
     """
-    array = np.array(hdu_list[hdu].data)
-
     if units in "COUNTS":
         array_electrons = (array * bscale) + bzero
     elif units in "CPS":
@@ -104,11 +99,9 @@ def extract_quadrant(file_path, quadrant_letter, bias_path=None):
     """
     Repeat for Bias.
     """
-    bias_hdu_list = fits.open(bias_path, do_not_scale_image_data=True)
-
-    bias = np.array(bias_hdu_list[hdu].data)
-
-    bias_ext_header = bias_hdu_list[hdu].header
+    with fits.open(bias_path, do_not_scale_image_data=True) as bias_hdu_list:
+        bias = np.array(bias_hdu_list[hdu].data)
+        bias_ext_header = bias_hdu_list[hdu].header
 
     bias_units = bias_ext_header["BUNIT"]
 
@@ -102,11 +102,12 @@ print("Found %d warm pixels" % warm_pixels.n_lines)
 """Output image of stack war pixel lines"""
 
 output_path = "dataset/examples/acs/lines"
+os.makedirs(output_path, exist_ok=True)
 
 # Plot the image and the found warm pixels
-plt.figure()
-im = plt.imshow(X=frame, aspect="equal", vmin=0, vmax=500)
-plt.scatter(
+fig, ax = plt.subplots()
+im = ax.imshow(X=frame, aspect="equal", vmin=0, vmax=500)
+ax.scatter(
     warm_pixels.locations[:, 1],
     warm_pixels.locations[:, 0],
     c="r",
@@ -114,10 +115,10 @@ plt.scatter(
     s=4,
     linewidth=0.2,
 )
-plt.colorbar(im)
-plt.axis("off")
-plt.savefig(f"{output_path}/find_warm_pixels.png", dpi=400)
-plt.close()
+fig.colorbar(im, ax=ax)
+ax.axis("off")
+fig.savefig(f"{output_path}/find_warm_pixels.png", dpi=400)
+plt.close(fig)
 print(f"Saved {output_path}/find_warm_pixels.png")
 
 """
@@ -125,7 +126,4 @@ Serialize the `LineCollection` so we can load it and convert it to a `CIImaging`
 `line_collection_to_ci.py`.
 """
 
-if not os.path.exists(output_path):
-    os.mkdir(output_path)
-
 warm_pixels.save(filename=f"{output_path}/{dataset_name}.pickle")
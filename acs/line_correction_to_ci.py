@@ -67,8 +67,7 @@ for i in range(lines.n_lines):
 
 output_path = f"dataset/examples/acs/lines/"
 
-if not os.path.exists(output_path):
-    os.mkdir(output_path)
+os.makedirs(output_path, exist_ok=True)
 
 with open(f"{output_path}/{dataset_name}_ci_imagings.pickle", "wb") as f:
     pickle.dump(ci_imagings, f)
@@ -16,9 +16,7 @@ LineCollection in autocti/data/pixel_lines.py for full details.
 
 import numpy as np
 import os
-from autoconf import conf
 import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 from urllib.request import urlretrieve
 
 import autocti as ac
@@ -47,13 +45,17 @@ dataset_names = [
     "j9epu6c0q_raw",
 ]
 
+file_paths = [
+    f"{dataset_path}/{dataset_name}{dataset_suffix}.fits"
+    for dataset_name in dataset_names
+]
+
 url_path = "http://astro.dur.ac.uk/~cklv53/files/acs"
 
-for dataset_name in dataset_names:
-    file = f"{dataset_path}/{dataset_name}{dataset_suffix}.fits"
-    if not os.path.exists(file):
+for dataset_name, file_path in zip(dataset_names, file_paths):
+    if not os.path.exists(file_path):
         print(f"\rDownloading {dataset_name}.fits...", end=" ", flush=True)
-        urlretrieve(f"{url_path}/{dataset_name}.fits", file)
+        urlretrieve(f"{url_path}/{dataset_name}.fits", file_path)
 print("")
 
 # Initialise the collection of warm pixel trails
@@ -111,12 +113,9 @@ def prescan_fitted_bias_column(prescan, n_rows=2048, n_rows_ov=20):
 
 print("1.")
 # Find the warm pixels in each image
-for dataset_name in dataset_names:
+for dataset_name, file_path in zip(dataset_names, file_paths):
     # Load the HST ACS dataset
-    frame = ac.acs.ImageACS.from_fits(
-        file_path=f"{dataset_path}/{dataset_name}{dataset_suffix}.fits",
-        quadrant_letter="A",
-    )
+    frame = ac.acs.ImageACS.from_fits(file_path=file_path, quadrant_letter="A")
     date = 2400000.5 + frame.header.modified_julian_date
 
     # Subtract from all columns the fitted prescan bias
@@ -184,13 +183,9 @@ n_background_bins = 2
 print("Stacked lines in %d bins" % (n_row_bins * n_flux_bins * n_background_bins))
 
 # Plot the stacked trails
-plt.figure(figsize=(25, 12))
-plt.subplots_adjust(wspace=0, hspace=0)
-gs = GridSpec(n_row_bins, n_flux_bins)
-axes = [
-    [plt.subplot(gs[i_row, i_flux]) for i_flux in range(n_flux_bins)]
-    for i_row in range(n_row_bins)
-]
+fig, axes = plt.subplots(
+    n_row_bins, n_flux_bins, figsize=(25, 12), gridspec_kw=dict(wspace=0, hspace=0)
+)
 length = int(np.amax(stacked_lines.lengths) / 2)
 pixels = np.arange(length)
 colours = plt.cm.jet(np.linspace(0.05, 0.95, n_background_bins))
@@ -273,14 +268,12 @@ for i_row in range(n_row_bins):
 """Output image of stack warm pixel lines"""
 
 output_path = f"dataset/examples/acs/lines"
+os.makedirs(output_path, exist_ok=True)
 
-plt.savefig(f"{output_path}/stack_warm_pixels.png", dpi=200)
-plt.close()
+fig.savefig(f"{output_path}/stack_warm_pixels.png", dpi=200)
+plt.close(fig)
 print(f"Saved {output_path}/stack_warm_pixels.png")
 
 """Serialize the `LineCollection` so we can load it in the CTI model fitting scripts."""
 
-if not os.path.exists(output_path):
-    os.mkdir(output_path)
-
 warm_pixels.save(filename=f"{output_path}/{dataset_name}_stacked.pickle")
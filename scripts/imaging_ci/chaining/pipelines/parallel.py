@@ -132,19 +132,27 @@ __Search + Analysis + Model-Fit (Search 1)__
 
 To reduce run-times, we trim the `ImagingCI` data from the high resolution data (e.g. 2000 columns) to just 50 columns 
 to speed up the model-fit at the expense of inferring larger errors on the CTI model.
+
+Every search in this pipeline inputs a `number_of_cores`, which parallelizes Dynesty's likelihood evaluations over 
+multiple CPUs and is described in `autocti_workspace/scripts/imaging_ci/modeling/uniform_ci.py`.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[1]_parallel[x1]", nlive=50
+    path_prefix=path_prefix,
+    name="search[1]_parallel[x1]",
+    nlive=50,
+    number_of_cores=1,
 )
 
+settings_imaging_ci = ac.ci.SettingsImagingCI(parallel_columns=(0, 50))
+
 imaging_ci_trimmed_list = [
-    imaging_ci.apply_settings(
-        settings=ac.ci.SettingsImagingCI(parallel_columns=(0, 50))
-    )
+    imaging_ci.apply_settings(settings=settings_imaging_ci)
     for imaging_ci in imaging_ci_list
 ]
 
-analysis = ac.AnalysisImagingCI(dataset_ci_list=imaging_ci_list, clocker=clocker)
+analysis = ac.AnalysisImagingCI(
+    dataset_ci_list=imaging_ci_trimmed_list, clocker=clocker
+)
 
 result_1 = search.fit(model=model, analysis=analysis)
 
@@ -189,7 +197,10 @@ This is necessary given that  many parameters in the model are not yet initializ
 We again use the trimmed `ImagingCI` data to speed up run-times.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[2]_parallel[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[2]_parallel[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(
@@ -213,10 +224,6 @@ The key difference from search 2 is that the value of every parameter is initial
 efficient non-linear search) and that we do not trim the data to only 50 parallel columns such that are errors are 
 representative of fitting all available data.
 """
-parallel_ccd = af.PriorModel(ac.CCDPhase)
-parallel_ccd.well_notch_depth = 0.0
-parallel_ccd.full_well_depth = 84700.0
-
 model = af.Collection(
     cti=af.Model(
         ac.CTI,
@@ -226,7 +233,10 @@ model = af.Collection(
 )
 
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[3]_parallel[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[3]_parallel[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(dataset_ci_list=imaging_ci_masked_list, clocker=clocker)
@@ -138,15 +138,21 @@ __Search + Analysis + Model-Fit (Search 1)__
 
 To reduce run-times, we trim the `ImagingCI` data from the high resolution data (e.g. 2000 columns) to just 50 columns 
 to speed up the model-fit at the expense of inferring larger errors on the CTI model.
+
+Every search in this pipeline inputs a `number_of_cores`, which parallelizes Dynesty's likelihood evaluations over 
+multiple CPUs and is described in `autocti_workspace/scripts/imaging_ci/modeling/uniform_ci.py`.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[1]_parallel[x1]", nlive=50
+    path_prefix=path_prefix,
+    name="search[1]_parallel[x1]",
+    nlive=50,
+    number_of_cores=1,
 )
 
+settings_imaging_ci = ac.ci.SettingsImagingCI(parallel_columns=(0, 50))
+
 imaging_ci_trimmed_list = [
-    imaging_ci.apply_settings(
-        settings=ac.ci.SettingsImagingCI(parallel_columns=(0, 50))
-    )
+    imaging_ci.apply_settings(settings=settings_imaging_ci)
     for imaging_ci in imaging_ci_list
 ]
 
@@ -197,7 +203,10 @@ This is necessary given that  many parameters in the model are not yet initializ
 We again use the trimmed `ImagingCI` data to speed up run-times.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[2]_parallel[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[2]_parallel[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(
@@ -236,11 +245,16 @@ To reduce run-times, we trim the `ImagingCI` data from the high resolution data
 every charge injection region to speed up the model-fit at the expense of inferring larger errors on the CTI model.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[3]_serial[x1]", nlive=50
+    path_prefix=path_prefix,
+    name="search[3]_serial[x1]",
+    nlive=50,
+    number_of_cores=1,
 )
 
+settings_imaging_ci = ac.ci.SettingsImagingCI(serial_rows=(0, 10))
+
 imaging_ci_trimmed_list = [
-    imaging_ci.apply_settings(settings=ac.ci.SettingsImagingCI(serial_rows=(0, 10)))
+    imaging_ci.apply_settings(settings=settings_imaging_ci)
     for imaging_ci in imaging_ci_list
 ]
 
@@ -289,7 +303,10 @@ This is necessary given that  many parameters in the model are not yet initializ
 We again use the trimmed `ImagingCI` data to speed up run-times.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[4]_serial[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[4]_serial[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(
@@ -334,7 +351,10 @@ To accurately clock parallel and serial CTI we cannot trim the data, thus the `I
 used.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[5]_parallel[multi]_serial[multi]", nlive=100
+    path_prefix=path_prefix,
+    name="search[5]_parallel[multi]_serial[multi]",
+    nlive=100,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(
@@ -131,13 +131,21 @@ __Search + Dataset + Analysis + Model-Fit (Search 1)__
 
 To reduce run-times, we trim the `ImagingCI` data from the high resolution data (e.g. 2000 columns) to just 10 rows of 
 every charge injection region to speed up the model-fit at the expense of inferring larger errors on the CTI model.
+
+Every search in this pipeline inputs a `number_of_cores`, which parallelizes Dynesty's likelihood evaluations over 
+multiple CPUs and is described in `autocti_workspace/scripts/imaging_ci/modeling/uniform_ci.py`.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[1]_serial[x1]", nlive=50
+    path_prefix=path_prefix,
+    name="search[1]_serial[x1]",
+    nlive=50,
+    number_of_cores=1,
 )
 
+settings_imaging_ci = ac.ci.SettingsImagingCI(serial_rows=(0, 10))
+
 imaging_ci_trimmed_list = [
-    imaging_ci.apply_settings(settings=ac.ci.SettingsImagingCI(serial_rows=(0, 10)))
+    imaging_ci.apply_settings(settings=settings_imaging_ci)
     for imaging_ci in imaging_ci_list
 ]
 
@@ -186,7 +194,10 @@ This is necessary given that  many parameters in the model are not yet initializ
 We again use the trimmed `ImagingCI` data to speed up run-times.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[2]_serial[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[2]_serial[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(
@@ -210,10 +221,6 @@ The key difference from search 2 is that the value of every parameter is initial
 efficient non-linear search) and that we do not trim the data to only 10 rows of serial trails such that are errors are 
 representative of fitting all available data.
 """
-serial_ccd = af.PriorModel(ac.CCDPhase)
-serial_ccd.well_notch_depth = 0.0
-serial_ccd.full_well_depth = 84700.0
-
 model = af.Collection(
     cti=af.Model(
         ac.CTI,
@@ -223,7 +230,10 @@ model = af.Collection(
 )
 
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[3]_serial[multi]", nlive=50
+    path_prefix=path_prefix,
+    name="search[3]_serial[multi]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(dataset_ci_list=imaging_ci_masked_list, clocker=clocker)
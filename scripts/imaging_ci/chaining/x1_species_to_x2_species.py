@@ -142,9 +142,16 @@ We now create the non-linear search, analysis and perform the model-fit using th
 
 You may wish to inspect the results of the search 1 model-fit to ensure a fast non-linear search has been provided that 
 provides a reasonably accurate CTI model.
+
+Both searches input a `number_of_cores`, which parallelizes Dynesty's likelihood evaluations over multiple CPUs and 
+is described in `autocti_workspace/scripts/imaging_ci/modeling/uniform_ci.py`. Increasing it is the simplest way to 
+speed up both searches, which each clock every `ImagingCI` dataset every likelihood evaluation.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[1]_species[x1]", nlive=50
+    path_prefix=path_prefix,
+    name="search[1]_species[x1]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(dataset_ci_list=imaging_ci_list, clocker=clocker)
@@ -194,7 +201,10 @@ __Search + Analysis + Model-Fit (Search 2)__
 We now create the non-linear search, analysis and perform the model-fit using this model.
 """
 search = af.DynestyStatic(
-    path_prefix=path_prefix, name="search[2]_species[x2]", nlive=50
+    path_prefix=path_prefix,
+    name="search[2]_species[x2]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 analysis = ac.AnalysisImagingCI(dataset_ci_list=imaging_ci_list, clocker=clocker)
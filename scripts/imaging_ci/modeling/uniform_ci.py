@@ -126,11 +126,7 @@ parallel_ccd.well_notch_depth = 0.0
 parallel_ccd.full_well_depth = 84700.0
 
 model = af.Collection(
-    cti=af.Model(
-        ac.CTI,
-        parallel_traps=[parallel_trap_0, parallel_trap_1],
-        parallel_ccd=parallel_ccd,
-    )
+    cti=af.Model(ac.CTI, parallel_traps=parallel_traps, parallel_ccd=parallel_ccd)
 )
 
 """
@@ -146,9 +142,22 @@ operates, checkout chapter 2 of the HowToCTI lecture series.
 The `name` and `path_prefix` below specify the path where results ae stored in the output folder:  
 
  `/autocti_workspace/output/imaging_ci/parallel[x2]`.
+
+__Number Of Cores__
+
+The `number_of_cores` input sets how many CPUs Dynesty uses to evaluate the likelihood of its live points in parallel. 
+Every likelihood evaluation clocks all of the `ImagingCI` datasets with arCTIc, which dominates the run-time of the 
+model-fit, so increasing this above 1 gives a near-linear speed up up to the number of cores on your computer.
+
+Parallel processing in Python uses the `multiprocessing` module, which on some operating systems (e.g. Windows and 
+newer versions of MacOS) requires the script to be wrapped in an `if __name__ == "__main__":` block. We therefore 
+leave this as 1 by default, but Linux users (or users running the script on a HPC) can increase it freely.
 """
 search = af.DynestyStatic(
-    path_prefix=path.join("imaging_ci", dataset_name), name="parallel[x2]", nlive=50
+    path_prefix=path.join("imaging_ci", dataset_name),
+    name="parallel[x2]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 """
@@ -160,8 +169,10 @@ the `ImagingCI`dataset.
 To reduce run-times, we trim the `ImagingCI` data from the high resolution data (e.g. 2000 columns) to just 50 columns 
 to speed up the model-fit at the expense of inferring larger errors on the CTI model.
 """
+settings_imaging_ci = ac.ci.SettingsImagingCI(parallel_columns=(0, 1))
+
 imaging_ci_trimmed_list = [
-    imaging_ci.apply_settings(settings=ac.ci.SettingsImagingCI(parallel_columns=(0, 1)))
+    imaging_ci.apply_settings(settings=settings_imaging_ci)
     for imaging_ci in imaging_ci_list
 ]
 
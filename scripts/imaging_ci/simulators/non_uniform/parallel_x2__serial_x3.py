@@ -116,12 +116,14 @@ The CTI model used by arCTIc to add CTI to the input image in the parallel direc
 """
 parallel_trap_0 = ac.TrapInstantCapture(density=0.13, release_timescale=1.25)
 parallel_trap_1 = ac.TrapInstantCapture(density=0.25, release_timescale=4.4)
+parallel_traps = [parallel_trap_0, parallel_trap_1]
 parallel_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
 serial_trap_0 = ac.TrapInstantCapture(density=0.0442, release_timescale=0.8)
 serial_trap_1 = ac.TrapInstantCapture(density=0.1326, release_timescale=4.0)
 serial_trap_2 = ac.TrapInstantCapture(density=3.9782, release_timescale=20.0)
+serial_traps = [serial_trap_0, serial_trap_1, serial_trap_2]
 serial_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
@@ -148,9 +150,9 @@ dataset_ci_list = [
     simulator.from_layout(
         layout=layout,
         clocker=clocker,
-        parallel_traps=[parallel_trap_0, parallel_trap_1],
+        parallel_traps=parallel_traps,
         parallel_ccd=parallel_ccd,
-        serial_traps=[serial_trap_0, serial_trap_1, serial_trap_2],
+        serial_traps=serial_traps,
         serial_ccd=serial_ccd,
     )
     for layout in layout_list
@@ -163,17 +165,13 @@ Output the image, noise-map and pre cti image of the charge injection dataset to
 """
 [
     dataset_ci.output_to_fits(
-        image_path=path.join(
-            dataset_path, f"image_{int(dataset_ci.layout.normalization)}"
-        ),
-        noise_map_path=path.join(
-            dataset_path, f"noise_map_{int(dataset_ci.layout.normalization)}"
-        ),
+        image_path=path.join(dataset_path, f"image_{normalization}.fits"),
+        noise_map_path=path.join(dataset_path, f"noise_map_{normalization}.fits"),
         pre_cti_image_path=path.join(
-            dataset_path, f"pre_cti_image_{int(dataset_ci.layout.normalization)}"
+            dataset_path, f"pre_cti_image_{normalization}.fits"
         ),
     )
-    for dataset_ci in dataset_ci_list
+    for dataset_ci, normalization in zip(dataset_ci_list, normalization_list)
 ]
 
 """
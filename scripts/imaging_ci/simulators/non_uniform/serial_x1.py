@@ -105,6 +105,7 @@ The CTI model used by arCTIc to add CTI to the input image in the serial directi
  - A simple CCD volume beta parametrization.
 """
 serial_trap = ac.TrapInstantCapture(density=0.5, release_timescale=4.0)
+serial_traps = [serial_trap]
 serial_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
@@ -132,7 +133,7 @@ dataset_ci_list = [
     simulator.from_layout(
         layout=layout,
         clocker=clocker,
-        serial_traps=[serial_trap],
+        serial_traps=serial_traps,
         serial_ccd=serial_ccd,
     )
     for layout in layout_list
@@ -145,17 +146,13 @@ Output the image, noise-map and pre cti image of the charge injection dataset to
 """
 [
     dataset_ci.output_to_fits(
-        image_path=path.join(
-            dataset_path, f"image_{int(dataset_ci.layout.normalization)}"
-        ),
-        noise_map_path=path.join(
-            dataset_path, f"noise_map_{int(dataset_ci.layout.normalization)}"
-        ),
+        image_path=path.join(dataset_path, f"image_{normalization}.fits"),
+        noise_map_path=path.join(dataset_path, f"noise_map_{normalization}.fits"),
         pre_cti_image_path=path.join(
-            dataset_path, f"pre_cti_image_{int(dataset_ci.layout.normalization)}"
+            dataset_path, f"pre_cti_image_{normalization}.fits"
         ),
     )
-    for dataset_ci in dataset_ci_list
+    for dataset_ci, normalization in zip(dataset_ci_list, normalization_list)
 ]
 
 """
@@ -109,6 +109,7 @@ The CTI model used by arCTIc to add CTI to the input image in the parallel direc
  - A simple CCD volume beta parametrization.
 """
 parallel_trap = ac.TrapInstantCapture(density=0.5, release_timescale=4.0)
+parallel_traps = [parallel_trap]
 parallel_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
@@ -159,7 +160,7 @@ dataset_ci_list = [
     simulator.from_layout(
         layout=layout,
         clocker=clocker,
-        parallel_traps=[parallel_trap],
+        parallel_traps=parallel_traps,
         parallel_ccd=parallel_ccd,
         cosmic_ray_map=cosmic_ray_map,
     )
@@ -173,17 +174,13 @@ Output the image, noise-map and pre cti image of the charge injection dataset to
 """
 [
     dataset_ci.output_to_fits(
-        image_path=path.join(
-            dataset_path, f"image_{int(dataset_ci.layout.normalization)}"
-        ),
-        noise_map_path=path.join(
-            dataset_path, f"noise_map_{int(dataset_ci.layout.normalization)}"
-        ),
+        image_path=path.join(dataset_path, f"image_{normalization}.fits"),
+        noise_map_path=path.join(dataset_path, f"noise_map_{normalization}.fits"),
         pre_cti_image_path=path.join(
-            dataset_path, f"pre_cti_image_{int(dataset_ci.layout.normalization)}"
+            dataset_path, f"pre_cti_image_{normalization}.fits"
         ),
     )
-    for dataset_ci in dataset_ci_list
+    for dataset_ci, normalization in zip(dataset_ci_list, normalization_list)
 ]
 
 """
@@ -101,6 +101,7 @@ The CTI model used by arCTIc to add CTI to the input image in the parallel direc
 """
 parallel_trap_0 = ac.TrapInstantCapture(density=0.13, release_timescale=1.25)
 parallel_trap_1 = ac.TrapInstantCapture(density=0.25, release_timescale=4.4)
+parallel_traps = [parallel_trap_0, parallel_trap_1]
 parallel_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
@@ -127,7 +128,7 @@ dataset_ci_list = [
     simulator.from_layout(
         clocker=clocker,
         layout=layout_ci,
-        parallel_traps=[parallel_trap_0, parallel_trap_1],
+        parallel_traps=parallel_traps,
         parallel_ccd=parallel_ccd,
     )
     for layout_ci in layout_list
@@ -150,17 +151,13 @@ Output the image, noise-map and pre cti image of the charge injection dataset to
 """
 [
     dataset_ci.output_to_fits(
-        image_path=path.join(
-            dataset_path, f"image_{int(dataset_ci.layout.normalization)}.fits"
-        ),
-        noise_map_path=path.join(
-            dataset_path, f"noise_map_{int(dataset_ci.layout.normalization)}.fits"
-        ),
+        image_path=path.join(dataset_path, f"image_{normalization}.fits"),
+        noise_map_path=path.join(dataset_path, f"noise_map_{normalization}.fits"),
         pre_cti_image_path=path.join(
-            dataset_path, f"pre_cti_image_{int(dataset_ci.layout.normalization)}.fits"
+            dataset_path, f"pre_cti_image_{normalization}.fits"
         ),
     )
-    for dataset_ci in dataset_ci_list
+    for dataset_ci, normalization in zip(dataset_ci_list, normalization_list)
 ]
 
 """
@@ -120,33 +120,25 @@ imaging_ci_plotter.subplot_imaging_ci()
 
 """
 We now need to mask the data, so that regions where there is no signal (e.g. the edges) are omitted from the fit.
+
+Every `Line` has the same shape, pixel scale and regions, so we create a single mask which is used for all of them.
 """
-mask_list = [
-    ac.ci.Mask2DCI.unmasked(
-        shape_native=line.shape_native, pixel_scales=line.pixel_scales
-    )
-    for line in line_list
-]
+mask = ac.ci.Mask2DCI.unmasked(
+    shape_native=line_list[0].shape_native, pixel_scales=line_list[0].pixel_scales
+)
 
-mask_list = [
-    ac.ci.Mask2DCI.masked_front_edges_and_trails_from_frame_ci(
-        mask=mask, frame_ci=line_list[0].image, settings=ac.ci.SettingsMask2DCI()
-    )
-    for mask in mask_list
-]
+mask = ac.ci.Mask2DCI.masked_front_edges_and_trails_from_frame_ci(
+    mask=mask, frame_ci=line_list[0].image, settings=ac.ci.SettingsMask2DCI()
+)
 
 """
 The MaskedImaging object combines the dataset with the mask.
 """
-masked_line_list = [
-    ac.ci.ImagingCI(imaging_ci=line, mask=mask)
-    for line, mask in zip(line_list, mask_list)
-]
+masked_line_list = [ac.ci.ImagingCI(imaging_ci=line, mask=mask) for line in line_list]
 
 """
 Here is what our image looks like with the mask applied.
 """
-imaging_ci_plotter = aplt.ImagingCIPlotter(imaging=line_list[0])
 imaging_ci_plotter.figures_2d(image=True)
 
 """
@@ -180,14 +172,12 @@ The fit creates the following:
  - The normalized residual-map: The residual-map divided by the noise-map.
  - The chi-squared-map: The normalized residual-map squared.
 
-we'll plot all 3 of these, alongside a subplot containing them all.
+we'll plot all 3 of these on a single subplot.
 
 For a good lens model where the model image and tracer are representative of the strong lens system the
 residuals, normalized residuals and chi-squareds are minimized:
 """
 fit_ci_plotter = aplt.FitImagingCIPlotter(fit=fit_list[0])
-fit_ci_plotter.figures_2d(
-    residual_map=True, normalized_residual_map=True, chi_squared_map=True
-)
+fit_ci_plotter.subplot_fit_ci()
 
-print(sum([fit.log_likelihood for fit in fit_list]))
+print(sum(fit.log_likelihood for fit in fit_list))
@@ -106,8 +106,8 @@ parallel_ccd = af.PriorModel(ac.CCDPhase)
 parallel_ccd.well_notch_depth = 0.0
 parallel_ccd.full_well_depth = 84700.0
 
-model = af.Collection(cti=af.Model(
-    ac.CTI, parallel_traps=[parallel_trap_0, parallel_trap_1], parallel_ccd=parallel_ccd
+model = af.Collection(
+    cti=af.Model(ac.CTI, parallel_traps=parallel_traps, parallel_ccd=parallel_ccd)
 )
 
 """
@@ -123,9 +123,15 @@ operates, checkout chapter 2 of the HowToCTI lecture series.
 The `name` and `path_prefix` below specify the path where results ae stored in the output folder:  
 
  `/autocti_workspace/output/line/parallel[x2]`.
+
+The `number_of_cores` input parallelizes Dynesty's likelihood evaluations over multiple CPUs, and is described in 
+`autocti_workspace/scripts/imaging_ci/modeling/uniform_ci.py`.
 """
 search = af.DynestyStatic(
-    path_prefix=path.join("line", dataset_name), name="parallel[x2]", nlive=50
+    path_prefix=path.join("line", dataset_name),
+    name="parallel[x2]",
+    nlive=50,
+    number_of_cores=1,
 )
 
 """
@@ -107,7 +107,15 @@ line_dataset_list = [
     for pattern_ci in line_pattern_list
 ]
 
-imaging_ci_plotter = aplt.ImagingCIPlotter(imaging=line_dataset_list[0])
+"""
+Output a subplot of the simulated `Line` to the dataset path as .png files, as opposed to displaying it, so that the
+script does not block on an interactive figure window when datasets are regenerated.
+"""
+mat_plot_2d = aplt.MatPlot2D(output=aplt.Output(path=dataset_path, format="png"))
+
+imaging_ci_plotter = aplt.ImagingCIPlotter(
+    imaging=line_dataset_list[0], mat_plot_2d=mat_plot_2d
+)
 imaging_ci_plotter.subplot_imaging_ci()
 
 """
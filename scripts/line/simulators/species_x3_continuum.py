@@ -77,6 +77,7 @@ trap_2 = ac.TrapLogNormalLifetimeContinuum(
     density=0.00285, release_timescale_mu=20.0, release_timescale_sigma=0.2
 )
 
+traps = [trap_0, trap_1, trap_2]
 ccd = ac.CCDPhase(well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0)
 
 """
@@ -110,13 +111,21 @@ line_dataset_list = [
     simulator.from_pattern_ci(
         clocker=clocker,
         pattern_ci=pattern_ci,
-        parallel_traps=[trap_0, trap_1, trap_2],
+        parallel_traps=traps,
         parallel_ccd=ccd,
     )
     for pattern_ci in line_pattern_list
 ]
 
-imaging_ci_plotter = aplt.ImagingCIPlotter(imaging=line_dataset_list[0])
+"""
+Output a subplot of the simulated `Line` to the dataset path as .png files, as opposed to displaying it, so that the
+script does not block on an interactive figure window when datasets are regenerated.
+"""
+mat_plot_2d = aplt.MatPlot2D(output=aplt.Output(path=dataset_path, format="png"))
+
+imaging_ci_plotter = aplt.ImagingCIPlotter(
+    imaging=line_dataset_list[0], mat_plot_2d=mat_plot_2d
+)
 imaging_ci_plotter.subplot_imaging_ci()
 
 """
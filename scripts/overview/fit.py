@@ -69,24 +69,21 @@ imaging_ci_plotter.subplot_imaging_ci()
 
 """
 We now need to mask the data, so that regions where there is no signal (e.g. the edges) are omitted from the fit.
+
+Every `Line` has the same shape and pixel scale, so we create a single mask which is used for all of them.
 """
-mask_list = [
-    ac.Mask2D.unmasked(shape_native=line.shape_native, pixel_scales=line.pixel_scales)
-    for line in line_list
-]
+mask = ac.Mask2D.unmasked(
+    shape_native=line_list[0].shape_native, pixel_scales=line_list[0].pixel_scales
+)
 
 """
 The MaskedImaging object combines the dataset with the mask.
 """
-masked_line_list = [
-    ac.ci.ImagingCI(imaging_ci=line, mask=mask)
-    for line, mask in zip(line_list, mask_list)
-]
+masked_line_list = [ac.ci.ImagingCI(imaging_ci=line, mask=mask) for line in line_list]
 
 """
 Here is what our image looks like with the mask applied.
 """
-imaging_ci_plotter = aplt.ImagingCIPlotter(imaging=line_list[0])
 imaging_ci_plotter.figures_2d(image=True)
 
 """
@@ -134,17 +131,15 @@ The fit creates the following:
  - The normalized residual-map: The residual-map divided by the noise-map.
  - The chi-squared-map: The normalized residual-map squared.
 
-we'll plot all 3 of these, alongside a subplot containing them all.
+we'll plot all 3 of these on a single subplot.
 
 For a good lens model where the model image and tracer are representative of the strong lens system the
 residuals, normalized residuals and chi-squareds are minimized:
 """
 fit_ci_plotter = aplt.FitImagingCIPlotter(fit=fit_list[0])
-fit_ci_plotter.figures_2d(
-    residual_map=True, normalized_residual_map=True, chi_squared_map=True
-)
+fit_ci_plotter.subplot_fit_ci()
 
-print(sum([fit.log_likelihood for fit in fit_list]))
+print(sum(fit.log_likelihood for fit in fit_list))
 
 """
 In contrast, a bad CTI model will show features in the residual-map and chi-squareds.
@@ -173,8 +168,6 @@ fit_list = [
 ]
 
 fit_ci_plotter = aplt.FitImagingCIPlotter(fit=fit_list[0])
-fit_ci_plotter.figures_2d(
-    residual_map=True, normalized_residual_map=True, chi_squared_map=True
-)
+fit_ci_plotter.subplot_fit_ci()
 
-print(sum([fit.log_likelihood for fit in fit_list]))
+print(sum(fit.log_likelihood for fit in fit_list))
@@ -95,6 +95,7 @@ This is the true CTI model used to simulate the dataset.
 """
 parallel_trap_0 = ac.TrapInstantCapture(density=0.13, release_timescale=1.25)
 parallel_trap_1 = ac.TrapInstantCapture(density=0.25, release_timescale=4.4)
+parallel_traps = [parallel_trap_0, parallel_trap_1]
 parallel_ccd = ac.CCDPhase(
     well_fill_power=0.8, well_notch_depth=0.0, full_well_depth=84700.0
 )
@@ -105,7 +106,7 @@ Make a post-CTI image from the pre-CTI images in our `ImagingCI` dataset, using
 post_cti_image_list = [
     clocker.add_cti(
         image_pre_cti=imaging_ci.pre_cti_image,
-        parallel_traps=[parallel_trap_0, parallel_trap_1],
+        parallel_traps=parallel_traps,
         parallel_ccd=parallel_ccd,
     )
     for imaging_ci in imaging_ci_list